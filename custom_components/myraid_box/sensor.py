@@ -156,7 +156,8 @@ class MyriadBoxSensor(CoordinatorEntity, SensorEntity):
             self._attr_available = True
                 
             self.async_write_ha_state()
-            _LOGGER.debug("[%s] 状态已更新: %s", self.entity_id, new_value)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("[%s] 状态已更新: %s", self.entity_id, new_value)
                 
         except Exception as e:
             _LOGGER.error("[%s] 更新失败: %s", self.entity_id, str(e))
@@ -8,6 +8,12 @@ import time
 import json
 import asyncio
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # orjson不可用时回退到标准库
+    json_loads = json.loads
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -27,6 +33,8 @@ class SensorConfig(TypedDict, total=False):
 class RequestConfig:
     """请求配置类"""
     
+    __slots__ = ("url", "method", "params", "data", "json_data", "headers", "timeout")
+    
     def __init__(
         self,
         url: str,
@@ -53,6 +61,11 @@ class BaseService(ABC):
     DEFAULT_UPDATE_INTERVAL = 10
     DEFAULT_API_URL = ""
     DEFAULT_TIMEOUT = 30
+    
+    # 连接池配置 - 同一会话内复用keep-alive连接
+    CONNECTION_LIMIT = 20
+    CONNECTION_LIMIT_PER_HOST = 8
+    KEEPALIVE_TIMEOUT = 120
 
     def __init__(self):
         """初始化服务实例"""
@@ -113,6 +126,11 @@ class BaseService(ABC):
         interval_minutes = int(self.config_fields.get("interval", {}).get("default", self.DEFAULT_UPDATE_INTERVAL))
         return timedelta(minutes=interval_minutes)
 
+    @property
+    def default_headers(self) -> Dict[str, str]:
+        """返回HTTP会话默认请求头 - 子类可覆盖"""
+        return {}
+
     # === 传感器配置 ===
     @property
     def sensor_configs(self) -> List[SensorConfig]:
@@ -134,7 +152,16 @@ class BaseService(ABC):
         """确保会话存在"""
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=self.default_timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            connector = aiohttp.TCPConnector(
+                limit=self.CONNECTION_LIMIT,
+                limit_per_host=self.CONNECTION_LIMIT_PER_HOST,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT
+            )
+            self._session = aiohttp.ClientSession(
+                timeout=timeout,
+                connector=connector,
+                headers=self.default_headers
+            )
             _LOGGER.debug("[%s] 创建HTTP会话，超时: %s秒", self.service_id, self.default_timeout)
 
     # === 主入口方法 ===
@@ -164,8 +191,9 @@ class BaseService(ABC):
         # 构建基础请求
         base_config = self._build_base_request(params)
         
-        # 添加认证头
-        headers = {**base_config.headers, **self._build_auth_headers(token)}
+        # 添加认证头（无基础请求头时直接复用认证头，避免重新合并）
+        auth_headers = self._build_auth_headers(token)
+        headers = {**base_config.headers, **auth_headers} if base_config.headers else auth_headers
         
         return RequestConfig(
             url=base_config.url,
@@ -240,11 +268,11 @@ class BaseService(ABC):
         content_type = resp.headers.get("Content-Type", "").lower()
         
         if "application/json" in content_type:
-            return await resp.json()
+            return await resp.json(loads=json_loads)
         else:
             text_data = await resp.text()
             try:
-                return json.loads(text_data)
+                return json_loads(text_data)
             except json.JSONDecodeError:
                 return text_data
 